@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+from functools import cached_property
+from pathlib import PurePosixPath
+from typing import TYPE_CHECKING, Any
+
+import fsspec
+from kedro.io.core import Version, get_filepath_str
+
+if TYPE_CHECKING:
+    from pyarrow.fs import FileSystem, PyFileSystem
+
+
+def _sort_options(options: Any) -> Any:
+    if isinstance(options, dict):
+        return {key: _sort_options(options[key]) for key in sorted(options, key=str)}
+    return options
+
+
+def get_filesystem(
+    protocol: str, storage_options: dict[str, Any]
+) -> fsspec.AbstractFileSystem:
+    """
+    Returns the ``fsspec`` filesystem for ``protocol`` and ``storage_options``.
+    ``fsspec`` reuses filesystem instances, and so their connection pools, for
+    identical constructor arguments, but tells them apart by their written order.
+    Options are sorted, including nested ones such as ``client_kwargs``, so that
+    datasets with the same credentials share one filesystem.
+    """
+    return fsspec.filesystem(protocol, **_sort_options(storage_options))
+
+
+def copy_options(options: dict[str, Any] | None) -> dict[str, Any]:
+    """
+    Returns a copy of ``options`` in which nested dictionaries, such as
+    ``client_kwargs``, are copied too, which is far cheaper than ``deepcopy``.
+    Values nested any deeper are shared with ``options``.
+    """
+    return {
+        key: dict(value) if isinstance(value, dict) else value
+        for key, value in (options or {}).items()
+    }
+
+
+def flatten_client_kwargs(storage_options: dict[str, Any]) -> dict[str, Any]:
+    """
+    Returns a copy of ``storage_options`` with its ``client_kwargs`` merged in, as
+    ``s3fs`` takes the endpoint, region and keys through ``botocore``'s client.
+    """
+    options = dict(storage_options)
+    options.update(options.pop("client_kwargs", {}))
+    return options
+
+
+def to_pyarrow_filesystem(fs: fsspec.AbstractFileSystem) -> PyFileSystem:
+    """Returns a ``pyarrow`` view of the ``fsspec`` filesystem ``fs``."""
+    from pyarrow.fs import FSSpecHandler, PyFileSystem  # noqa: PLC0415
+
+    return PyFileSystem(FSSpecHandler(fs))
+
+
+class FsspecDatasetMixin:
+    """
+    Paths and ``pyarrow`` view of the ``fsspec`` filesystem of a dataset.
+    The path of non-versioned datasets is built only once; versioned ones are
+    resolved on each call, as their version can change between calls.
+    """
+
+    _filepath: PurePosixPath
+    _protocol: str
+    _version: Version | None
+    _fs: fsspec.AbstractFileSystem
+
+    if TYPE_CHECKING:
+
+        def _get_load_path(self) -> PurePosixPath: ...
+
+        def _get_save_path(self) -> PurePosixPath: ...
+
+    @cached_property
+    def _filepath_str(self) -> str:
+        return get_filepath_str(self._filepath, self._protocol)
+
+    def _get_load_path_str(self) -> str:
+        if not self._version:
+            # Non-versioned datasets always load from ``filepath``
+            return self._filepath_str
+        return get_filepath_str(self._get_load_path(), self._protocol)
+
+    def _get_save_path_str(self) -> str:
+        if not self._version:
+            return self._filepath_str
+        return get_filepath_str(self._get_save_path(), self._protocol)
+
+    @cached_property
+    def _pa_fs(self) -> FileSystem:
+        """``pyarrow`` view of the filesystem, built once and reused."""
+        return to_pyarrow_filesystem(self._fs)
+
+    def _reset_pa_fs(self) -> None:
+        """Drop the cached ``pyarrow`` filesystem, to be rebuilt on next use."""
+        self.__dict__.pop("_pa_fs", None)
+
+    def _make_parent_dir(self, save_path: str) -> None:
+        """Create the parent directory of a local ``save_path``. Local files are
+        written natively by pyarrow or Polars, skipping ``fsspec``'s Python buffer,
+        so its ``auto_mkdir`` does not apply to them.
+        """
+        self._fs.makedirs(str(PurePosixPath(save_path).parent), exist_ok=True)
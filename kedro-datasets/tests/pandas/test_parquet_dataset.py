@@ -2,16 +2,21 @@ import inspect
 from pathlib import Path, PurePosixPath
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as pads
+import pyarrow.parquet as pq
 import pytest
 from fsspec.implementations.http import HTTPFileSystem
 from fsspec.implementations.local import LocalFileSystem
 from gcsfs import GCSFileSystem
-from kedro.io.core import PROTOCOL_DELIMITER, DatasetError, Version
+from kedro.io.core import PROTOCOL_DELIMITER, DatasetError, Version, get_filepath_str
 from pandas.testing import assert_frame_equal
-from pyarrow.fs import FSSpecHandler, PyFileSystem
+from pyarrow.fs import FileType, FSSpecHandler, PyFileSystem
+from pyarrow.fs import S3FileSystem as PyArrowS3FileSystem
 from s3fs.core import S3FileSystem
 
 from kedro_datasets.pandas import ParquetDataset
+from kedro_datasets.pandas.parquet_dataset import _to_pyarrow_s3_options
 
 FILENAME = "test.parquet"
 
@@ -64,6 +69,39 @@ class TestParquetDataset:
 
         mock_fs.assert_called_once_with("file", auto_mkdir=True, **credentials)
 
+    def test_options_not_mutated(self):
+        """Test that the caller's credentials and fs_args are left untouched."""
+        credentials = {"key": "k", "secret": "s"}
+        fs_args = {
+            "open_args_load": {"cache_type": "none"},
+            "client_kwargs": {"region_name": "eu-west-1"},
+        }
+        dataset = ParquetDataset(
+            filepath="s3://bucket/a.parquet", credentials=credentials, fs_args=fs_args
+        )
+        dataset._storage_options["client_kwargs"]["region_name"] = "us-east-1"
+
+        assert credentials == {"key": "k", "secret": "s"}
+        assert fs_args == {
+            "open_args_load": {"cache_type": "none"},
+            "client_kwargs": {"region_name": "eu-west-1"},
+        }
+
+    def test_filesystem_shared(self):
+        """Test that datasets with the same options, in any order, share their
+        filesystem and its connection pool."""
+        dataset = ParquetDataset(
+            filepath="s3://bucket/a.parquet",
+            credentials={"key": "k", "secret": "s"},
+            fs_args={"client_kwargs": {"region_name": "eu-west-1", "verify": False}},
+        )
+        other_dataset = ParquetDataset(
+            filepath="s3://bucket/b.parquet",
+            credentials={"secret": "s", "key": "k"},
+            fs_args={"client_kwargs": {"verify": False, "region_name": "eu-west-1"}},
+        )
+        assert dataset._fs is other_dataset._fs
+
     def test_save_and_load(self, tmp_path, dummy_dataframe):
         """Test saving and reloading the dataset."""
         filepath = (tmp_path / FILENAME).as_posix()
@@ -107,6 +145,128 @@ class TestParquetDataset:
         for key, value in save_args.items():
             assert parquet_dataset._save_args[key] == value
 
+    @pytest.mark.parametrize(
+        "load_args", [{"filters": [("col1", ">", 1)]}], indirect=True
+    )
+    @pytest.mark.parametrize("save_args", [{"row_group_size": 1}], indirect=True)
+    def test_load_filters(self, parquet_dataset, dummy_dataframe):
+        """Test that row filters are pushed down to the Parquet reader."""
+        parquet_dataset.save(dummy_dataframe)
+        reloaded = parquet_dataset.load()
+        assert_frame_equal(
+            reloaded.reset_index(drop=True),
+            dummy_dataframe[dummy_dataframe["col1"] > 1].reset_index(drop=True),
+        )
+
+    def test_project(self, parquet_dataset, dummy_dataframe):
+        """Test that a projected copy only loads the given columns."""
+        parquet_dataset.save(dummy_dataframe)
+        projected = parquet_dataset.project(["col1", "col3"])
+
+        assert_frame_equal(projected.load(), dummy_dataframe[["col1", "col3"]])
+        assert projected._fs is parquet_dataset._fs
+        assert "columns" not in parquet_dataset._load_args
+
+    @pytest.mark.parametrize(
+        "load_args,expected_columns",
+        [({}, ["col2"]), ({"columns": ["col1"]}, ["col1"])],
+        indirect=["load_args"],
+    )
+    def test_needed_columns(self, parquet_dataset, dummy_dataframe, expected_columns):
+        """Test that ``needed_columns`` projects loads without explicit `columns`."""
+        parquet_dataset.save(dummy_dataframe)
+        parquet_dataset.needed_columns = ["col2"]
+
+        assert_frame_equal(parquet_dataset.load(), dummy_dataframe[expected_columns])
+        assert parquet_dataset.preview()["columns"] == expected_columns
+
+    def test_save_and_load_attrs(self, parquet_dataset, filepath_parquet):
+        """Test that ``DataFrame.attrs`` are saved as pandas does, and reloaded."""
+        data = pd.DataFrame({"col1": [1, 2]})
+        data.attrs = {"source": "test", "version": 1}
+        parquet_dataset.save(data)
+
+        assert parquet_dataset.load().attrs == data.attrs
+        assert pd.read_parquet(filepath_parquet).attrs == data.attrs
+
+    @pytest.mark.parametrize(
+        "save_args",
+        [{"index": False, "row_group_size": 1, "compression": "gzip"}],
+        indirect=True,
+    )
+    def test_save_pyarrow_args(self, parquet_dataset, filepath_parquet, save_args):
+        """Test that save arguments are mapped onto ``pyarrow`` when writing."""
+        data = pd.DataFrame({"col1": [1, 2]}, index=["a", "b"])
+        parquet_dataset.save(data)
+
+        metadata = pq.ParquetFile(filepath_parquet).metadata
+        assert metadata.num_row_groups == 2
+        assert metadata.schema.names == ["col1"]
+        assert metadata.row_group(0).column(0).compression == "GZIP"
+
+    @pytest.mark.parametrize(
+        "save_args,expected_compression",
+        [({}, "ZSTD"), ({"compression": "snappy"}, "SNAPPY")],
+        indirect=["save_args"],
+    )
+    def test_save_pyarrow_defaults(
+        self, parquet_dataset, filepath_parquet, dummy_dataframe, expected_compression
+    ):
+        """Test that ZSTD is the default codec, and that other codecs can be used
+        without the default compression level."""
+        parquet_dataset.save(dummy_dataframe)
+
+        metadata = pq.ParquetFile(filepath_parquet).metadata
+        assert metadata.format_version == "2.6"
+        assert metadata.row_group(0).column(0).compression == expected_compression
+        assert_frame_equal(parquet_dataset.load(), dummy_dataframe)
+
+    def test_save_local_skips_fsspec(self, parquet_dataset, dummy_dataframe, mocker):
+        """Test that local files are written by pyarrow without an fsspec handle."""
+        open_spy = mocker.spy(parquet_dataset._fs, "open")
+        parquet_dataset.save(dummy_dataframe)
+
+        open_spy.assert_not_called()
+        assert_frame_equal(parquet_dataset.load(), dummy_dataframe)
+
+    @pytest.mark.parametrize(
+        "save_args", [{"nthreads": 2, "safe": False, "index": False}], indirect=True
+    )
+    def test_save_from_pandas_args(self, parquet_dataset, dummy_dataframe, mocker):
+        """Test that ``Table.from_pandas`` arguments are not passed to the writer."""
+        from_pandas_spy = mocker.patch("pyarrow.Table", wraps=pa.Table).from_pandas
+        write_table_spy = mocker.spy(pq, "write_table")
+        parquet_dataset.save(dummy_dataframe)
+
+        from_pandas_spy.assert_called_once_with(
+            dummy_dataframe, preserve_index=False, nthreads=2, safe=False
+        )
+        _, kwargs = write_table_spy.call_args
+        assert not {"nthreads", "safe", "index"} & kwargs.keys()
+        assert_frame_equal(parquet_dataset.load(), dummy_dataframe)
+
+    @pytest.mark.parametrize("save_args", [{"engine": "fastparquet"}], indirect=True)
+    def test_save_other_engine(self, parquet_dataset, dummy_dataframe, mocker):
+        """Test that saving with another engine is left to pandas."""
+        mock_to_parquet = mocker.patch.object(pd.DataFrame, "to_parquet")
+        mock_write_table = mocker.patch("pyarrow.parquet.write_table")
+
+        parquet_dataset.save(dummy_dataframe)
+
+        mock_to_parquet.assert_called_once_with(mocker.ANY, engine="fastparquet")
+        mock_write_table.assert_not_called()
+
+    @pytest.mark.parametrize(
+        "filepath,expected_open_args_save",
+        [
+            ("s3://bucket/file.parquet", {"mode": "wb", "block_size": 32 * 1024**2}),
+            ("/tmp/test.parquet", {"mode": "wb"}),
+        ],
+    )
+    def test_open_args_save_block_size(self, filepath, expected_open_args_save):
+        dataset = ParquetDataset(filepath=filepath)
+        assert dataset._fs_open_args_save == expected_open_args_save
+
     @pytest.mark.parametrize(
         "load_args,save_args",
         [
@@ -129,19 +289,22 @@ class TestParquetDataset:
         assert "storage_options" not in ds._save_args
         assert "storage_options" not in ds._load_args
 
-    def test_load_missing_file(self, parquet_dataset):
+    def test_load_missing_file(self, parquet_dataset, mocker):
         """Check the error when trying to load missing file."""
+        read_table_spy = mocker.spy(pq, "read_table")
         pattern = r"Failed while loading data from dataset ParquetDataset\(.*\)"
         with pytest.raises(DatasetError, match=pattern):
             parquet_dataset.load()
+        # Missing files are not retried without memory mapping
+        read_table_spy.assert_called_once()
 
     @pytest.mark.parametrize(
         "filepath,instance_type,load_path",
         [
-            ("s3://bucket/file.parquet", S3FileSystem, "s3://bucket/file.parquet"),
+            ("s3://bucket/file.parquet", S3FileSystem, "bucket/file.parquet"),
             ("file:///tmp/test.parquet", LocalFileSystem, "/tmp/test.parquet"),
             ("/tmp/test.parquet", LocalFileSystem, "/tmp/test.parquet"),
-            ("gcs://bucket/file.parquet", GCSFileSystem, "gcs://bucket/file.parquet"),
+            ("gcs://bucket/file.parquet", GCSFileSystem, "bucket/file.parquet"),
             (
                 "https://example.com/file.parquet",
                 HTTPFileSystem,
@@ -158,11 +321,17 @@ class TestParquetDataset:
         assert str(dataset._filepath) == path
         assert isinstance(dataset._filepath, PurePosixPath)
 
-        mocker.patch.object(dataset._fs, "isdir", return_value=False)
-        mock_pandas_call = mocker.patch("pandas.read_parquet")
+        mocker.patch.object(
+            dataset._fs, "info", return_value={"type": "file", "size": 1}
+        )
+        mock_open = mocker.patch.object(dataset._fs, "open")
+        mock_pyarrow_call = mocker.patch("pyarrow.parquet.read_table")
         dataset.load()
-        assert mock_pandas_call.call_count == 1
-        assert mock_pandas_call.call_args_list[0][0][0] == load_path
+        mock_pyarrow_call.assert_called_once()
+        if dataset._protocol == "file":
+            assert mock_pyarrow_call.call_args_list[0][0][0] == load_path
+        else:
+            mock_open.assert_called_once_with(load_path, mode="rb", size=1)
 
     @pytest.mark.parametrize(
         "protocol,path", [("https://", "example.com/"), ("s3://", "bucket/")]
@@ -176,9 +345,34 @@ class TestParquetDataset:
             filepath = path + FILENAME
         fs_mock.invalidate_cache.assert_called_once_with(filepath)
 
+    def test_filepath_str_reused(self, parquet_dataset, dummy_dataframe, mocker):
+        """Test that the path of non-versioned datasets is only built once."""
+        get_filepath_str_spy = mocker.patch(
+            "kedro_datasets._utils.fsspec_utils.get_filepath_str",
+            wraps=get_filepath_str,
+        )
+        parquet_dataset.save(dummy_dataframe)
+        parquet_dataset.load()
+        parquet_dataset.preview()
+        assert parquet_dataset.exists()
+        parquet_dataset.release()
+
+        get_filepath_str_spy.assert_called_once()
+
+    def test_pyarrow_filesystem_reused(self, parquet_dataset, dummy_dataframe):
+        """Test that the pyarrow filesystem is built once and reset on release."""
+        pa_fs = parquet_dataset._pa_fs
+        parquet_dataset.save(dummy_dataframe)
+        parquet_dataset.load()
+        parquet_dataset.preview()
+        assert parquet_dataset._pa_fs is pa_fs
+
+        parquet_dataset.release()
+        assert parquet_dataset._pa_fs is not pa_fs
+
     def test_read_partitioned_file(self, mocker, tmp_path, dummy_dataframe):
         """Test read partitioned parquet file from local directory."""
-        mock_pandas_call = mocker.patch("pandas.read_parquet", wraps=pd.read_parquet)
+        dataset_spy = mocker.spy(pads, "dataset")
         dummy_dataframe.to_parquet(str(tmp_path), partition_cols=["col2"])
         dataset = ParquetDataset(filepath=tmp_path.as_posix())
 
@@ -190,7 +384,140 @@ class TestParquetDataset:
         assert_frame_equal(
             dummy_dataframe, reloaded, check_dtype=False, check_categorical=False
         )
-        mock_pandas_call.assert_called_once()
+        assert isinstance(reloaded["col2"].dtype, pd.CategoricalDtype)
+        dataset_spy.assert_called_once()
+
+    @pytest.mark.parametrize("load_args", [{"prefetch_batches": 4}], indirect=True)
+    def test_load_prefetch_batches(self, parquet_dataset, dummy_dataframe, mocker):
+        """Test that ``prefetch_batches`` sets the read-ahead of a dataset scan."""
+        parquet_dataset.save(dummy_dataframe)
+        dataset_spy = mocker.spy(pads, "dataset")
+
+        assert_frame_equal(parquet_dataset.load(), dummy_dataframe)
+        dataset_spy.assert_called_once()
+
+        mock_dataset_call = mocker.patch("pyarrow.dataset.dataset")
+        parquet_dataset.load()
+        mock_dataset_call.return_value.to_table.assert_called_once_with(
+            columns=None, filter=None, use_threads=True, batch_readahead=4
+        )
+
+    @pytest.mark.parametrize(
+        "load_args",
+        [{"prefetch_batches": 4, "read_dictionary": ["col1"]}],
+        indirect=True,
+    )
+    def test_load_prefetch_batches_read_table_args(
+        self, parquet_dataset, mocker, caplog
+    ):
+        """Test that scans fall back to ``read_table`` for other arguments."""
+        mock_pyarrow_call = mocker.patch("pyarrow.parquet.read_table")
+        parquet_dataset.load()
+
+        _, kwargs = mock_pyarrow_call.call_args
+        assert "prefetch_batches" not in kwargs
+        assert kwargs["read_dictionary"] == ["col1"]
+        assert "Ignoring load argument 'prefetch_batches'" in caplog.text
+
+    @pytest.mark.parametrize(
+        "load_args",
+        [{"prefetch_batches": 2, "dtype_backend": "pyarrow"}],
+        indirect=True,
+    )
+    def test_load_prefetch_batches_pandas_reader(
+        self, parquet_dataset, dummy_dataframe, caplog
+    ):
+        """Test that ``prefetch_batches`` is not passed to ``pandas.read_parquet``."""
+        parquet_dataset.save(dummy_dataframe)
+
+        reloaded = parquet_dataset.load()
+        assert_frame_equal(reloaded, dummy_dataframe, check_dtype=False)
+        assert "Ignoring load argument 'prefetch_batches'" in caplog.text
+
+    @pytest.mark.parametrize(
+        "load_args", [{"prefetch_batches": 2, "columns": ["a"]}], indirect=True
+    )
+    def test_load_prefetch_batches_keeps_index(self, parquet_dataset):
+        """Test that projected scans of a single file restore the pandas index."""
+        data = pd.DataFrame(
+            {"a": [1, 2], "b": [3, 4]}, index=pd.Index(["x", "y"], name="idx")
+        )
+        parquet_dataset.save(data)
+
+        assert_frame_equal(parquet_dataset.load(), data[["a"]])
+
+    def test_load_prefetch_batches_file_in_partition_dir(self, tmp_path):
+        """Test that scans of a single file do not add partition columns from
+        ``key=value`` directories in its path."""
+        data = pd.DataFrame({"a": [1, 2]})
+        filepath = (tmp_path / "run=1" / "test.parquet").as_posix()
+        ParquetDataset(filepath=filepath).save(data)
+        dataset = ParquetDataset(filepath=filepath, load_args={"prefetch_batches": 2})
+
+        assert_frame_equal(dataset.load(), data)
+
+    @pytest.mark.parametrize(
+        "filters", [[("col2", "=", 4)], pads.field("col2") == 4], ids=["dnf", "expr"]
+    )
+    def test_read_partitioned_file_projected(self, tmp_path, dummy_dataframe, filters):
+        """Test that projections and filters are pushed into partitioned scans."""
+        dummy_dataframe.to_parquet(str(tmp_path), partition_cols=["col2"])
+        dataset = ParquetDataset(
+            filepath=tmp_path.as_posix(),
+            load_args={"columns": ["col1", "col2"], "filters": filters},
+        )
+
+        reloaded = dataset.load()
+        assert list(reloaded.columns) == ["col1", "col2"]
+        assert reloaded["col2"].astype(int).tolist() == [4]
+        assert reloaded["col1"].tolist() == [1]
+
+    @pytest.mark.parametrize("project", [False, True], ids=["columns", "project"])
+    def test_read_dir_projected_keeps_index(self, tmp_path, project):
+        """Test that projected directory scans still restore the pandas index."""
+        data = pd.DataFrame(
+            {"a": [1, 2], "b": [3, 4]}, index=pd.Index(["x", "y"], name="idx")
+        )
+        data.to_parquet(tmp_path / "part-0.parquet")
+        data.to_parquet(tmp_path / "part-1.parquet")
+        if project:
+            dataset = ParquetDataset(filepath=tmp_path.as_posix()).project(["a"])
+        else:
+            dataset = ParquetDataset(
+                filepath=tmp_path.as_posix(), load_args={"columns": ["a"]}
+            )
+
+        assert_frame_equal(dataset.load(), pd.concat([data, data])[["a"]])
+
+    def test_read_remote_dir_projected_keeps_index(self):
+        """Test that projected remote directory scans restore the pandas index."""
+        data = pd.DataFrame(
+            {"a": [1, 2], "b": [3, 4]}, index=pd.Index(["x", "y"], name="idx")
+        )
+        dataset = ParquetDataset(
+            filepath="memory://bucket/partitioned", load_args={"columns": ["a"]}
+        )
+        for part in ("part-0", "part-1"):
+            with dataset._fs.open(f"{dataset._filepath_str}/{part}.parquet", "wb") as f:
+                data.to_parquet(f)
+
+        try:
+            assert_frame_equal(dataset.load(), pd.concat([data, data])[["a"]])
+        finally:
+            dataset._fs.rm(dataset._filepath_str, recursive=True)
+
+    def test_read_remote_file_with_open_mode(self, dummy_dataframe):
+        """Test that an explicit read mode in ``open_args_load`` is accepted."""
+        dataset = ParquetDataset(
+            filepath="memory://bucket/test.parquet",
+            fs_args={"open_args_load": {"mode": "rb"}},
+        )
+        dataset.save(dummy_dataframe)
+
+        try:
+            assert_frame_equal(dataset.load(), dummy_dataframe)
+        finally:
+            dataset._fs.rm(dataset._filepath_str)
 
     def test_write_to_dir(self, dummy_dataframe, tmp_path):
         dataset = ParquetDataset(filepath=tmp_path.as_posix())
@@ -199,21 +526,224 @@ class TestParquetDataset:
         with pytest.raises(DatasetError, match=pattern):
             dataset.save(dummy_dataframe)
 
+    def test_write_to_non_local_skips_local_stat(self, dummy_dataframe, mocker):
+        """Test that remote saves do not look the path up on the local disk."""
+        is_dir_spy = mocker.spy(Path, "is_dir")
+        dataset = ParquetDataset(filepath="memory://bucket/test.parquet")
+        dataset.save(dummy_dataframe)
+
+        is_dir_spy.assert_not_called()
+        assert_frame_equal(dataset.load(), dummy_dataframe)
+        dataset._fs.rm(dataset._filepath_str)
+
     def test_read_from_non_local_dir(self, mocker):
-        mock_pandas_call = mocker.patch("pandas.read_parquet")
+        mock_dataset_call = mocker.patch("pyarrow.dataset.dataset")
 
         dataset = ParquetDataset(filepath="s3://bucket/dir")
+        mocker.patch.object(dataset._fs, "info", return_value={"type": "directory"})
+        mock_open = mocker.patch.object(dataset._fs, "open")
 
         dataset.load()
-        assert mock_pandas_call.call_count == 1
+        mock_dataset_call.assert_called_once_with(
+            "bucket/dir",
+            filesystem=dataset._pa_fs,
+            format=mocker.ANY,
+            partitioning=mocker.ANY,
+        )
+        call_kwargs = mock_dataset_call.call_args.kwargs
+        assert call_kwargs["format"].default_fragment_scan_options.pre_buffer
+        assert call_kwargs["partitioning"].type_name == "hive"
+        mock_dataset_call.return_value.to_table.assert_called_once_with(
+            columns=None, filter=None, use_threads=True
+        )
+        mock_open.assert_not_called()
 
-    def test_read_from_file(self, mocker):
+    def test_read_from_s3_native(self, mocker):
+        """Test that S3 files are read through pyarrow's native filesystem."""
+        mock_pyarrow_call = mocker.patch("pyarrow.parquet.read_table")
+
+        dataset = ParquetDataset(
+            filepath="s3://bucket/file.parquet",
+            credentials={"key": "k", "secret": "s"},
+            fs_args={"client_kwargs": {"region_name": "eu-west-1"}},
+        )
+        assert isinstance(dataset._pa_fs, PyArrowS3FileSystem)
+        assert dataset._pa_fs.region == "eu-west-1"
+
+        mock_pa_fs = mocker.MagicMock(type_name="s3")
+        mock_pa_fs.get_file_info.return_value.type = FileType.File
+        dataset.__dict__["_pa_fs"] = mock_pa_fs
+        mock_info = mocker.patch.object(dataset._fs, "info")
+
+        dataset.load()
+        mock_pa_fs.get_file_info.assert_called_once_with("bucket/file.parquet")
+        mock_pa_fs.open_input_file.assert_called_once_with(
+            mock_pa_fs.get_file_info.return_value
+        )
+        mock_pyarrow_call.assert_called_once_with(
+            mock_pa_fs.open_input_file.return_value.__enter__.return_value,
+            pre_buffer=True,
+            use_pandas_metadata=True,
+            use_threads=True,
+        )
+        mock_info.assert_not_called()
+
+    @pytest.mark.parametrize(
+        "protocol,storage_options,expected",
+        [
+            (
+                "s3",
+                {"key": "k", "secret": "s", "client_kwargs": {"region_name": "r"}},
+                {"access_key": "k", "secret_key": "s", "region": "r"},
+            ),
+            (
+                "s3",
+                {"anon": True, "endpoint_url": "http://localhost:9000"},
+                {
+                    "anonymous": True,
+                    "endpoint_override": "localhost:9000",
+                    "scheme": "http",
+                },
+            ),
+            ("s3", {"key": "k", "secret": "s"}, None),
+            ("s3", {"profile": "dev", "client_kwargs": {"region_name": "r"}}, None),
+            ("gcs", {}, None),
+        ],
+    )
+    def test_pyarrow_s3_options(self, protocol, storage_options, expected):
+        assert _to_pyarrow_s3_options(protocol, storage_options) == expected
+
+    def test_read_from_non_local_file_info(self, mocker):
+        """Test that remote files are opened with the size from a single lookup."""
+        mock_pyarrow_call = mocker.patch("pyarrow.parquet.read_table")
+
+        dataset = ParquetDataset(
+            filepath="s3://bucket/file.parquet",
+            fs_args={"open_args_load": {"cache_type": "none"}},
+        )
+        mock_info = mocker.patch.object(
+            dataset._fs, "info", return_value={"type": "file", "size": 1024}
+        )
+        mock_open = mocker.patch.object(dataset._fs, "open")
+
+        dataset.load()
+        mock_info.assert_called_once_with("bucket/file.parquet")
+        mock_open.assert_called_once_with(
+            "bucket/file.parquet", mode="rb", size=1024, cache_type="none"
+        )
+        assert (
+            mock_pyarrow_call.call_args.args[0]
+            is mock_open.return_value.__enter__.return_value
+        )
+
+    @pytest.mark.parametrize(
+        "load_args,expected_pre_buffer",
+        [({}, True), ({"pre_buffer": False}, False)],
+    )
+    def test_read_from_non_local_pre_buffer(
+        self, mocker, load_args, expected_pre_buffer
+    ):
+        """Test that remote reads coalesce column chunk requests by default."""
+        mock_pyarrow_call = mocker.patch("pyarrow.parquet.read_table")
+
+        dataset = ParquetDataset(
+            filepath="s3://bucket/file.parquet",
+            load_args={"engine": "pyarrow", **load_args},
+        )
+        mocker.patch.object(
+            dataset._fs, "info", return_value={"type": "file", "size": 1}
+        )
+        mocker.patch.object(dataset._fs, "open")
+
+        dataset.load()
+        _, kwargs = mock_pyarrow_call.call_args
+        assert kwargs["pre_buffer"] is expected_pre_buffer
+        assert kwargs["use_threads"] is True
+        assert "engine" not in kwargs
+        mock_pyarrow_call.return_value.to_pandas.assert_called_once_with(
+            self_destruct=True, split_blocks=True, types_mapper=None
+        )
+
+    @pytest.mark.parametrize(
+        "load_args",
+        [
+            {"engine": "fastparquet"},
+            {"dtype_backend": "pyarrow"},
+            {"use_nullable_dtypes": True},
+        ],
+    )
+    def test_read_from_non_local_pandas_args(self, mocker, load_args):
+        """Test that pandas-specific load arguments are still honoured remotely."""
         mock_pandas_call = mocker.patch("pandas.read_parquet")
+        mock_pyarrow_call = mocker.patch("pyarrow.parquet.read_table")
+
+        dataset = ParquetDataset(
+            filepath="s3://bucket/file.parquet", load_args=load_args
+        )
+
+        dataset.load()
+        mock_pandas_call.assert_called_once_with(
+            "s3://bucket/file.parquet", storage_options={}, **load_args
+        )
+        mock_pyarrow_call.assert_not_called()
+
+    def test_read_from_file(self, mocker):
+        mock_pyarrow_call = mocker.patch("pyarrow.parquet.read_table")
 
         dataset = ParquetDataset(filepath="/tmp/test.parquet")
 
         dataset.load()
-        assert mock_pandas_call.call_count == 1
+        mock_pyarrow_call.assert_called_once_with(
+            "/tmp/test.parquet",
+            memory_map=True,
+            pre_buffer=False,
+            use_pandas_metadata=True,
+            use_threads=True,
+        )
+        mock_pyarrow_call.return_value.to_pandas.assert_called_once_with(
+            self_destruct=True, split_blocks=True, types_mapper=None
+        )
+
+    def test_read_from_file_without_memory_map(self, mocker):
+        """Test that local reads fall back when files cannot be memory-mapped."""
+        table = mocker.Mock()
+        table.schema.metadata = None
+        mock_pyarrow_call = mocker.patch(
+            "pyarrow.parquet.read_table", side_effect=[OSError("mmap failed"), table]
+        )
+
+        dataset = ParquetDataset(filepath="/tmp/test.parquet")
+
+        assert dataset.load() is table.to_pandas.return_value
+        assert mock_pyarrow_call.call_count == 2
+        mock_pyarrow_call.assert_called_with(
+            "/tmp/test.parquet", use_pandas_metadata=True, use_threads=True
+        )
+
+    @pytest.mark.parametrize("load_args", [{"arrow_dtypes": True}], indirect=True)
+    def test_load_arrow_dtypes(self, parquet_dataset, dummy_dataframe):
+        """Test that ``arrow_dtypes`` loads Arrow-backed columns."""
+        parquet_dataset.save(dummy_dataframe)
+        reloaded = parquet_dataset.load()
+
+        assert all(isinstance(dtype, pd.ArrowDtype) for dtype in reloaded.dtypes)
+        assert_frame_equal(
+            reloaded, dummy_dataframe.convert_dtypes(dtype_backend="pyarrow")
+        )
+
+    @pytest.mark.parametrize(
+        "load_args",
+        [{"arrow_dtypes": True, "engine": "fastparquet"}],
+        indirect=True,
+    )
+    def test_load_arrow_dtypes_pandas_reader(self, parquet_dataset, mocker):
+        """Test that ``arrow_dtypes`` maps onto pandas' `dtype_backend`."""
+        mock_pandas_call = mocker.patch("pandas.read_parquet")
+        parquet_dataset.load()
+
+        mock_pandas_call.assert_called_once_with(
+            mocker.ANY, engine="fastparquet", dtype_backend="pyarrow"
+        )
 
     def test_arg_partition_cols(self, dummy_dataframe, tmp_path):
         dataset = ParquetDataset(
@@ -251,6 +781,47 @@ class TestParquetDataset:
             == "TablePreview"
         )
 
+    @pytest.mark.parametrize("save_args", [{"row_group_size": 2}], indirect=True)
+    @pytest.mark.parametrize(
+        "load_args", [{"columns": ["col1", "col3"]}], indirect=True
+    )
+    def test_preview_reads_first_row_groups(
+        self, parquet_dataset, dummy_dataframe_preview, mocker
+    ):
+        """Test that preview projects columns and stops after enough rows."""
+        parquet_dataset.save(dummy_dataframe_preview)
+        iter_batches_spy = mocker.spy(pq.ParquetFile, "iter_batches")
+
+        previewed_data = parquet_dataset.preview(nrows=3)
+
+        assert previewed_data["columns"] == ["col1", "col3"]
+        assert previewed_data["data"] == [[1, 5], [2, 6], [3, 7]]
+        iter_batches_spy.assert_called_once()
+
+    def test_preview_empty_file(self, parquet_dataset, dummy_dataframe_preview):
+        parquet_dataset.save(dummy_dataframe_preview.iloc[:0])
+        previewed_data = parquet_dataset.preview()
+
+        assert previewed_data["data"] == []
+        assert previewed_data["columns"] == list(dummy_dataframe_preview.columns)
+
+    @pytest.mark.parametrize("nrows", [0, -1])
+    def test_preview_no_rows(self, parquet_dataset, dummy_dataframe_preview, nrows):
+        parquet_dataset.save(dummy_dataframe_preview)
+        previewed_data = parquet_dataset.preview(nrows=nrows)
+
+        assert previewed_data["data"] == []
+        assert previewed_data["columns"] == list(dummy_dataframe_preview.columns)
+
+    def test_preview_partitioned_dir(self, tmp_path, dummy_dataframe_preview):
+        dummy_dataframe_preview.to_parquet(str(tmp_path), partition_cols=["col2"])
+        dataset = ParquetDataset(filepath=tmp_path.as_posix())
+
+        previewed_data = dataset.preview(nrows=2)
+
+        assert len(previewed_data["data"]) == 2
+        assert sorted(previewed_data["columns"]) == ["col1", "col2", "col3"]
+
 
 class TestParquetDatasetVersioned:
     def test_version_str_repr(self, load_version, save_version):
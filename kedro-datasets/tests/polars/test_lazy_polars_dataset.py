@@ -1,22 +1,28 @@
+import logging
 import re
 from pathlib import Path, PurePosixPath
 from time import sleep
 
 import boto3
 import polars as pl
+import pyarrow.dataset as ds
 import pytest
 from adlfs import AzureBlobFileSystem
 from fsspec.implementations.http import HTTPFileSystem
 from fsspec.implementations.local import LocalFileSystem
 from gcsfs import GCSFileSystem
 from kedro.io import DatasetError, Version
-from kedro.io.core import PROTOCOL_DELIMITER, generate_timestamp
+from kedro.io.core import PROTOCOL_DELIMITER, generate_timestamp, get_filepath_str
 from moto import mock_aws
 from polars.testing import assert_frame_equal
 from s3fs.core import S3FileSystem
 
 from kedro_datasets.polars import LazyPolarsDataset
-from kedro_datasets.polars.lazy_polars_dataset import ACCEPTED_FILE_FORMATS
+from kedro_datasets.polars.lazy_polars_dataset import (
+    ACCEPTED_FILE_FORMATS,
+    _log_csv_hint,
+    _to_polars_storage_options,
+)
 
 BUCKET_NAME = "test_bucket"
 FILE_NAME = "test.csv"
@@ -106,6 +112,18 @@ def mocked_csv_in_s3(mocked_s3_bucket, dummy_dataframe):
     return f"s3://{BUCKET_NAME}/{FILE_NAME}"
 
 
+@pytest.fixture
+def mocked_parquet_in_s3(mocked_s3_bucket, dummy_dataframe, tmp_path):
+    parquet_path = tmp_path / "test.parquet"
+    dummy_dataframe.write_parquet(parquet_path)
+    mocked_s3_bucket.put_object(
+        Bucket=BUCKET_NAME,
+        Key="test.parquet",
+        Body=parquet_path.read_bytes(),
+    )
+    return f"s3://{BUCKET_NAME}/test.parquet"
+
+
 class TestLazyCSVDataset:
     """Test class for LazyPolarsDataset csv functionality"""
 
@@ -130,11 +148,115 @@ class TestLazyCSVDataset:
         loaded_df = ds.load().collect()
         assert_frame_equal(loaded_df, dummy_dataframe)
 
+    def test_load_s3_missing_file(self, mocked_s3_bucket, mocker):
+        """Test that remote loads rely on pyarrow to report missing files."""
+        dataset = LazyPolarsDataset(
+            filepath=f"s3://{BUCKET_NAME}/missing.csv", file_format="csv"
+        )
+        exists_spy = mocker.spy(dataset._fs, "exists")
+
+        with pytest.raises(DatasetError, match="missing.csv"):
+            dataset.load()
+        exists_spy.assert_not_called()
+
     def test_save_and_load(self, csv_dataset, dummy_dataframe):
         csv_dataset.save(dummy_dataframe)
         reloaded_df = csv_dataset.load().collect()
         assert_frame_equal(dummy_dataframe, reloaded_df)
 
+    def test_csv_hint_logged_once(self, filepath_csv, caplog):
+        _log_csv_hint.cache_clear()
+        with caplog.at_level(logging.INFO):
+            LazyPolarsDataset(filepath=filepath_csv, file_format="csv")
+            LazyPolarsDataset(filepath=filepath_csv, file_format="csv")
+
+        hints = [r for r in caplog.records if "transcode_to_parquet" in r.message]
+        assert len(hints) == 1
+
+    def test_transcode_to_parquet(self, csv_dataset, dummy_dataframe, tmp_path):
+        csv_dataset.save(dummy_dataframe)
+        parquet_dataset = csv_dataset.transcode_to_parquet(
+            (tmp_path / "test.parquet").as_posix()
+        )
+
+        assert parquet_dataset._file_format == "parquet"
+        assert_frame_equal(dummy_dataframe, parquet_dataset.load().collect())
+
+    def test_transcode_to_parquet_options(self, tmp_path, mocker):
+        """Test that the Parquet dataset gets the same credentials and fs_args."""
+        csv_dataset = LazyPolarsDataset(
+            filepath=(tmp_path / FILE_NAME).as_posix(),
+            file_format="csv",
+            credentials={"key": "k"},
+            fs_args={"open_args_save": {"block_size": 1024}},
+        )
+        mocker.patch.object(csv_dataset, "load")
+        dataset_mock = mocker.patch(
+            "kedro_datasets.polars.lazy_polars_dataset.LazyPolarsDataset"
+        )
+        csv_dataset.transcode_to_parquet((tmp_path / "test.parquet").as_posix())
+
+        _, kwargs = dataset_mock.call_args
+        assert kwargs["credentials"] == {"key": "k"}
+        assert kwargs["fs_args"]["open_args_save"] == {"mode": "wb", "block_size": 1024}
+
+    def test_transcode_to_parquet_other_filesystem(self, csv_dataset):
+        pattern = "Cannot transcode file .* to a s3 file"
+        with pytest.raises(DatasetError, match=pattern):
+            csv_dataset.transcode_to_parquet("s3://bucket/test.parquet")
+
+    def test_transcode_parquet_to_parquet(self, parquet_dataset, tmp_path):
+        pattern = "Only CSV datasets can be transcoded to Parquet"
+        with pytest.raises(DatasetError, match=pattern):
+            parquet_dataset.transcode_to_parquet((tmp_path / "test2.pq").as_posix())
+
+    def test_filepath_str_reused(self, csv_dataset, dummy_dataframe, mocker):
+        """Test that the path of non-versioned datasets is only built once."""
+        get_filepath_str_spy = mocker.patch(
+            "kedro_datasets._utils.fsspec_utils.get_filepath_str",
+            wraps=get_filepath_str,
+        )
+        csv_dataset.save(dummy_dataframe)
+        csv_dataset.load()
+        assert csv_dataset.exists()
+        csv_dataset.release()
+
+        get_filepath_str_spy.assert_called_once()
+
+    def test_save_local_skips_fsspec(self, csv_dataset, dummy_dataframe, mocker):
+        """Test that local files are written by Polars without an fsspec handle."""
+        open_spy = mocker.spy(csv_dataset._fs, "open")
+        csv_dataset.save(dummy_dataframe)
+
+        open_spy.assert_not_called()
+        assert_frame_equal(dummy_dataframe, csv_dataset.load().collect())
+
+    def test_save_lazy_sinks(self, csv_dataset, dummy_dataframe, mocker):
+        """Test that a local LazyFrame is streamed to disk without collecting it."""
+        collect_spy = mocker.spy(pl.LazyFrame, "collect")
+        csv_dataset.save(dummy_dataframe.lazy())
+
+        collect_spy.assert_not_called()
+        assert_frame_equal(dummy_dataframe, csv_dataset.load().collect())
+
+    def test_save_lazy_not_streamable(self, csv_dataset, dummy_dataframe, mocker):
+        """Test that queries Polars cannot stream are collected and written."""
+        data = dummy_dataframe.lazy()
+        sink_csv = pl.LazyFrame.sink_csv
+
+        def sink_csv_not_streamable(self, *args, **kwargs):
+            # ``DataFrame.write_csv`` may sink a LazyFrame of its own
+            if self is data:
+                raise pl.exceptions.InvalidOperationError
+            return sink_csv(self, *args, **kwargs)
+
+        mocker.patch.object(pl.LazyFrame, "sink_csv", sink_csv_not_streamable)
+        collect_spy = mocker.spy(pl.LazyFrame, "collect")
+        csv_dataset.save(data)
+
+        collect_spy.assert_called_once()
+        assert_frame_equal(dummy_dataframe, csv_dataset.load().collect())
+
     def test_load_missing_file(self, csv_dataset):
         """Check the error when trying to load missing file."""
         pattern = r"Failed while loading data from dataset LazyPolarsDataset\(.*\)"
@@ -228,12 +350,189 @@ class TestLazyParquetDatasetVersioned:
         df = parquet_dataset_ignore.load().collect()
         assert df.shape == (2, 3)
 
+    @pytest.mark.parametrize(
+        "load_args",
+        [{"predicate": "col1 > 1"}, {"predicate": pl.col("col1") > 1}],
+        indirect=True,
+    )
+    def test_load_predicate(
+        self, parquet_dataset, dummy_dataframe, filepath_pq, load_args
+    ):
+        dummy_dataframe.write_parquet(filepath_pq)
+        df = parquet_dataset.load().collect()
+        assert_frame_equal(df, dummy_dataframe.filter(pl.col("col1") > 1))
+        assert "predicate" in parquet_dataset._load_args
+
+    @pytest.mark.parametrize("load_args", [{"predicate": "col1 > 1"}], indirect=True)
+    def test_load_s3_predicate(self, dummy_dataframe, mocked_parquet_in_s3, load_args):
+        dataset = LazyPolarsDataset(
+            filepath=mocked_parquet_in_s3,
+            file_format="parquet",
+            load_args=load_args,
+        )
+        df = dataset.load().collect()
+        assert_frame_equal(df, dummy_dataframe.filter(pl.col("col1") > 1))
+
+    def test_load_s3(self, dummy_dataframe, mocked_parquet_in_s3, mocker):
+        dataset_spy = mocker.spy(ds, "dataset")
+        dataset = LazyPolarsDataset(
+            filepath=mocked_parquet_in_s3,
+            file_format="parquet",
+        )
+
+        loaded_df = dataset.load().collect()
+        assert_frame_equal(loaded_df, dummy_dataframe)
+
+        file_format = dataset_spy.call_args.kwargs["format"]
+        assert isinstance(file_format, ds.ParquetFileFormat)
+        assert file_format.default_fragment_scan_options.pre_buffer
+
+    def test_load_s3_native(self, mocker):
+        """Test that Polars scans Parquet on S3 itself when credentials allow it."""
+        mock_scan_parquet = mocker.patch("polars.scan_parquet")
+        dataset = LazyPolarsDataset(
+            filepath="s3://bucket/file.parquet",
+            file_format="parquet",
+            credentials={
+                "key": "fake_key",
+                "secret": "fake_secret",
+                "client_kwargs": {"region_name": "eu-west-1"},
+            },
+            load_args={"native_scan": True, "low_memory": True},
+        )
+        mocker.patch.object(dataset._fs, "exists", return_value=True)
+
+        dataset.load()
+
+        mock_scan_parquet.assert_called_once_with(
+            "s3://bucket/file.parquet",
+            storage_options={
+                "aws_access_key_id": "fake_key",
+                "aws_secret_access_key": "fake_secret",
+                "aws_region": "eu-west-1",
+            },
+            low_memory=True,
+        )
+
+    def test_load_s3_without_native_scan(self, mocker):
+        """Test that remote ``load_args`` go to ``pyarrow.dataset`` unless Polars
+        scans are asked for, whatever the credentials."""
+        mock_scan_parquet = mocker.patch("polars.scan_parquet")
+        mock_dataset = mocker.patch("pyarrow.dataset.dataset")
+        mocker.patch("polars.scan_pyarrow_dataset")
+        dataset = LazyPolarsDataset(
+            filepath="s3://bucket/file.parquet",
+            file_format="parquet",
+            credentials={"key": "fake_key", "secret": "fake_secret"},
+            load_args={"partitioning": "hive"},
+        )
+
+        dataset.load()
+
+        mock_scan_parquet.assert_not_called()
+        assert mock_dataset.call_args.kwargs["partitioning"] == "hive"
+
+    @pytest.mark.parametrize(
+        "file_format,fs_args",
+        [("parquet", {"anon": True}), ("csv", {"key": "k", "secret": "s"})],
+    )
+    def test_load_native_scan_unsupported(self, file_format, fs_args):
+        """Test that ``native_scan`` is rejected when Polars cannot scan the file."""
+        dataset = LazyPolarsDataset(
+            filepath=f"s3://bucket/file.{file_format}",
+            file_format=file_format,
+            fs_args=fs_args,
+            load_args={"native_scan": True},
+        )
+        with pytest.raises(DatasetError, match="'native_scan' requires"):
+            dataset.load()
+
+    @pytest.mark.parametrize(
+        "protocol,storage_options,expected",
+        [
+            ("s3", {}, {}),
+            (
+                "s3",
+                {"key": "k", "secret": "s", "endpoint_url": "http://localhost"},
+                {
+                    "aws_access_key_id": "k",
+                    "aws_secret_access_key": "s",
+                    "aws_endpoint_url": "http://localhost",
+                },
+            ),
+            ("s3", {"anon": True}, None),
+            ("gcs", {"project": "my-project"}, {}),
+            ("gs", {"token": "/path/to/token.json"}, None),
+            (
+                "abfs",
+                {"account_name": "test", "account_key": "test"},
+                {"account_name": "test", "account_key": "test"},
+            ),
+            ("abfs", {"connection_string": "test"}, None),
+            ("https", {}, None),
+        ],
+    )
+    def test_polars_storage_options(self, protocol, storage_options, expected):
+        assert _to_polars_storage_options(protocol, storage_options) == expected
+
+    def test_pyarrow_filesystem_reused(self, mocked_parquet_in_s3):
+        """Test that the pyarrow filesystem is built once and reset on release."""
+        dataset = LazyPolarsDataset(
+            filepath=mocked_parquet_in_s3,
+            file_format="parquet",
+        )
+        pa_fs = dataset._pa_fs
+        dataset.load()
+        dataset.load()
+        assert dataset._pa_fs is pa_fs
+
+        dataset.release()
+        assert dataset._pa_fs is not pa_fs
+
+    @pytest.mark.parametrize(
+        "save_args,expected_save_args",
+        [
+            (
+                {},
+                {
+                    "compression": "zstd",
+                    "compression_level": 3,
+                    "data_page_size": 2**20,
+                },
+            ),
+            (
+                {"compression": "snappy"},
+                {"compression": "snappy", "data_page_size": 2**20},
+            ),
+        ],
+    )
+    def test_parquet_save_defaults(self, filepath_pq, save_args, expected_save_args):
+        dataset = LazyPolarsDataset(
+            filepath=filepath_pq, file_format="parquet", save_args=save_args
+        )
+        assert dataset._save_args == expected_save_args
+
+    def test_csv_save_defaults(self, filepath_csv):
+        dataset = LazyPolarsDataset(filepath=filepath_csv, file_format="csv")
+        assert dataset._save_args == {}
+
     def test_save_and_load(self, versioned_parquet_dataset, dummy_dataframe):
         """Test saving and reloading the dataset."""
         versioned_parquet_dataset.save(dummy_dataframe.lazy())
         reloaded_df = versioned_parquet_dataset.load().collect()
         assert_frame_equal(dummy_dataframe, reloaded_df)
 
+    def test_save_lazy_eager_only_args(self, filepath_pq, dummy_dataframe, mocker):
+        """Test that LazyFrames are collected for options that sinks lack."""
+        sink_spy = mocker.spy(pl.LazyFrame, "sink_parquet")
+        dataset = LazyPolarsDataset(
+            filepath=filepath_pq, file_format="parquet", save_args={"use_pyarrow": True}
+        )
+        dataset.save(dummy_dataframe.lazy())
+
+        sink_spy.assert_not_called()
+        assert_frame_equal(dummy_dataframe, dataset.load().collect())
+
     def test_version_str_repr(self, filepath_pq, load_version, save_version):
         """Test that version is in string representation of the class instance
         when applicable."""
@@ -8,9 +8,10 @@ import logging
 import os
 import sys
 import uuid
+from collections.abc import Callable
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import IO, Any
 
 import requests
 import toml
@@ -350,10 +351,14 @@ def _send_heap_event(
         )
 
 
-def _check_for_telemetry_consent(project_path: Path | None) -> bool:
+def _check_for_telemetry_consent(
+    project_path: Path | None,
+    _loader: Callable[[IO[str]], Any] = yaml.safe_load,
+) -> bool:
     """
     Use telemetry consent from ".telemetry" file if it exists and has a valid format.
     Telemetry is considered as opt-in otherwise.
+    The file is parsed with `_loader`, which tests can replace to skip YAML parsing.
     """
 
     for env_var in _SKIP_TELEMETRY_ENV_VAR_KEYS:
@@ -364,7 +369,7 @@ def _check_for_telemetry_consent(project_path: Path | None) -> bool:
         telemetry_file_path = project_path / ".telemetry"
         if telemetry_file_path.exists():
             with open(telemetry_file_path, encoding="utf-8") as telemetry_file:
-                telemetry = yaml.safe_load(telemetry_file)
+                telemetry = _loader(telemetry_file)
                 if _is_valid_syntax(telemetry):
                     return telemetry["consent"]
     return True
@@ -1,15 +1,16 @@
 import logging
 import sys
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import MagicMock
 
 import requests
-import yaml
+import toml
 from kedro import __version__ as kedro_version
 from kedro.framework.project import pipelines
 from kedro.framework.startup import ProjectMetadata
 from kedro.io import DataCatalog, MemoryDataset
-from kedro.pipeline import Pipeline, node
+from kedro.pipeline import node
 from kedro.pipeline import pipeline as modular_pipeline
 from pytest import fixture, mark
 
@@ -59,16 +60,42 @@ attr = "spaceflights.__version__"
 where = [ "src",]
 namespaces = false
 """
+MOCK_PYPROJECT_TOOLS_DATA = toml.loads(MOCK_PYPROJECT_TOOLS)
+
+# Event properties of the mocked project, shared by every event sent for it
+PROJECT_PROPERTIES = {
+    "username": "user_uuid",
+    "project_id": "digested",
+    "project_version": kedro_version,
+    "telemetry_version": TELEMETRY_VERSION,
+    "python_version": sys.version,
+    "os": sys.platform,
+    "is_ci_env": True,
+}
+PROJECT_STATISTICS = {
+    "number_of_datasets": 3,
+    "number_of_nodes": 2,
+    "number_of_pipelines": 2,
+}
+CONSENT_NOTICE = (
+    "Kedro is sending anonymous usage data with the sole purpose of improving the product. "
+    "No personal data or IP addresses are stored on our side. "
+    "If you want to opt out, set the `KEDRO_DISABLE_TELEMETRY` or `DO_NOT_TRACK` environment variables, "
+    "or create a `.telemetry` file in the current working directory with the contents `consent: false`. "
+    "Read more at https://docs.kedro.org/en/stable/configuration/telemetry.html"
+)
 
 
-@fixture
-def fake_metadata(tmp_path):
+@fixture(scope="module")
+def fake_metadata(tmp_path_factory):
+    project_path = tmp_path_factory.mktemp("repo") / REPO_NAME
+    project_path.mkdir()
     metadata = ProjectMetadata(
-        config_file=tmp_path / REPO_NAME / "pyproject.toml",
+        config_file=project_path / "pyproject.toml",
         package_name=PACKAGE_NAME,
         project_name="CLI Testing Project",
-        project_path=tmp_path / REPO_NAME,
-        source_dir=tmp_path / REPO_NAME / "src",
+        project_path=project_path,
+        source_dir=project_path / "src",
         kedro_init_version=kedro_version,
         tools=[],
         example_pipeline="No",
@@ -77,6 +104,14 @@ def fake_metadata(tmp_path):
 
 
 @fixture
+def telemetry_file_path(fake_metadata):
+    """Path of the project's ``.telemetry`` file, removed again after each test."""
+    telemetry_file_path = fake_metadata.project_path / ".telemetry"
+    yield telemetry_file_path
+    telemetry_file_path.unlink(missing_ok=True)
+
+
+@fixture(scope="module")
 def fake_catalog():
     catalog = DataCatalog(
         {
@@ -103,7 +138,7 @@ def fake_context():
     return MockKedroContext()
 
 
-@fixture
+@fixture(scope="module")
 def fake_default_pipeline():
     mock_default_pipeline = modular_pipeline(
         [
@@ -114,7 +149,7 @@ def fake_default_pipeline():
     return mock_default_pipeline
 
 
-@fixture
+@fixture(scope="module")
 def fake_sub_pipeline():
     mock_sub_pipeline = modular_pipeline(
         [
@@ -125,202 +160,138 @@ def fake_sub_pipeline():
 
 
 @fixture
-def pipeline_fixture() -> Pipeline:
-    mock_pipeline = MagicMock(spec=Pipeline)
-    mock_pipeline.nodes = ["node1", "node2"]
-    return mock_pipeline
+def pipeline_fixture() -> SimpleNamespace:
+    # Only `nodes` is read from the default pipeline
+    return SimpleNamespace(nodes=["node1", "node2"])
 
 
 @fixture
-def project_pipelines() -> dict[str, Pipeline]:
+def project_pipelines() -> dict[str, SimpleNamespace]:
     return {
-        "pipeline1": MagicMock(spec=Pipeline),
-        "pipeline2": MagicMock(spec=Pipeline),
+        "pipeline1": SimpleNamespace(nodes=["node1"]),
+        "pipeline2": SimpleNamespace(nodes=["node2"]),
     }
 
 
-class TestKedroTelemetryHook:
-    def test_before_command_run(self, mocker, fake_metadata, caplog):
-        mocker.patch(
-            "kedro_telemetry.plugin._check_for_telemetry_consent", return_value=True
-        )
-        mocker.patch("kedro_telemetry.plugin._is_known_ci_env", return_value=True)
-        mocked_anon_id = mocker.patch("kedro_telemetry.plugin._hash")
-        mocked_anon_id.return_value = "digested"
-        mocker.patch("kedro_telemetry.plugin.PACKAGE_NAME", "spaceflights")
-        mocker.patch(
-            "kedro_telemetry.plugin._get_or_create_uuid",
-            return_value="user_uuid",
-        )
-        mocker.patch(
-            "kedro_telemetry.plugin._get_or_create_project_id",
-            return_value="project_id",
-        )
+@fixture
+def mocked_heap_call(mocker, monkeypatch):
+    """Give telemetry consent, patch the user and project identifiers, and return
+    the mocked ``_send_heap_event``."""
+    monkeypatch.setattr(
+        "kedro_telemetry.plugin._check_for_telemetry_consent", lambda *_: True
+    )
+    monkeypatch.setattr("kedro_telemetry.plugin._is_known_ci_env", lambda *_: True)
+    monkeypatch.setattr("kedro_telemetry.plugin._hash", lambda *_: "digested")
+    monkeypatch.setattr("kedro_telemetry.plugin.PACKAGE_NAME", "spaceflights")
+    monkeypatch.setattr(
+        "kedro_telemetry.plugin._get_or_create_uuid", lambda *_: "user_uuid"
+    )
+    monkeypatch.setattr(
+        "kedro_telemetry.plugin._get_or_create_project_id", lambda *_: "project_id"
+    )
+    return mocker.patch("kedro_telemetry.plugin._send_heap_event")
 
-        mocked_heap_call = mocker.patch("kedro_telemetry.plugin._send_heap_event")
 
-        with caplog.at_level(logging.INFO):
-            telemetry_hook = KedroTelemetryHook()
-            command_args = ["--version"]
-            telemetry_hook.before_command_run(fake_metadata, command_args)
-            telemetry_hook.after_command_run()
-        expected_properties = {
-            "username": "user_uuid",
-            "project_id": "digested",
-            "project_version": kedro_version,
-            "telemetry_version": TELEMETRY_VERSION,
-            "python_version": sys.version,
-            "os": sys.platform,
-            "is_ci_env": True,
-            "command": "kedro --version",
-        }
-        generic_properties = {
-            **expected_properties,
-            "main_command": "--version",
-        }
+@fixture
+def known_ci_vars():
+    # Because our CI runs on Github Actions, this would always return True otherwise.
+    # The plugin's own set is copied, so that other tests still see the full set
+    return KNOWN_CI_ENV_VAR_KEYS - {"GITHUB_ACTION"}
 
-        expected_calls = [
-            mocker.call(
-                event_name="CLI command",
-                identity="user_uuid",
-                properties=generic_properties,
-            ),
-        ]
-        assert mocked_heap_call.call_args_list == expected_calls
-        assert any(
-            "Kedro is sending anonymous usage data with the sole purpose of improving the product. "
-            "No personal data or IP addresses are stored on our side. "
-            "If you want to opt out, set the `KEDRO_DISABLE_TELEMETRY` or `DO_NOT_TRACK` environment variables, "
-            "or create a `.telemetry` file in the current working directory with the contents `consent: false`. "
-            "Read more at https://docs.kedro.org/en/stable/configuration/telemetry.html"
-            in record.message
-            for record in caplog.records
-        )
 
-    def test_before_command_run_with_tools(self, mocker, fake_metadata):
-        mocker.patch(
-            "kedro_telemetry.plugin._check_for_telemetry_consent", return_value=True
-        )
-        mocker.patch("kedro_telemetry.plugin._is_known_ci_env", return_value=True)
-        mocked_anon_id = mocker.patch("kedro_telemetry.plugin._hash")
-        mocked_anon_id.return_value = "digested"
-        mocker.patch("kedro_telemetry.plugin.PACKAGE_NAME", "spaceflights")
-        mocker.patch(
-            "kedro_telemetry.plugin._get_or_create_uuid",
-            return_value="user_uuid",
-        )
-        mocker.patch(
-            "kedro_telemetry.plugin._get_or_create_project_id",
-            return_value="project_id",
-        )
+@fixture
+def telemetry_hook():
+    return KedroTelemetryHook()
 
-        mocked_heap_call = mocker.patch("kedro_telemetry.plugin._send_heap_event")
-        mocker.patch("builtins.open", mocker.mock_open(read_data=MOCK_PYPROJECT_TOOLS))
-        mocker.patch("pathlib.Path.exists", return_value=True)
-        telemetry_hook = KedroTelemetryHook()
-        command_args = ["--version"]
-        telemetry_hook.before_command_run(fake_metadata, command_args)
-        telemetry_hook.after_command_run()
-        expected_properties = {
-            "username": "user_uuid",
-            "project_id": "digested",
-            "project_version": kedro_version,
-            "telemetry_version": TELEMETRY_VERSION,
-            "python_version": sys.version,
-            "os": sys.platform,
-            "is_ci_env": True,
-            "command": "kedro --version",
-            "tools": "Linting, Testing, Custom Logging, Documentation, Data Structure, PySpark",
-            "example_pipeline": "True",
-        }
-        generic_properties = {
-            **expected_properties,
-            "main_command": "--version",
-        }
 
-        expected_calls = [
-            mocker.call(
-                event_name="CLI command",
-                identity="user_uuid",
-                properties=generic_properties,
+class TestKedroTelemetryHook:
+    @mark.parametrize(
+        "command_args,pyproject_data,command_properties",
+        [
+            (
+                ["--version"],
+                None,
+                {"command": "kedro --version", "main_command": "--version"},
             ),
-        ]
-        assert mocked_heap_call.call_args_list == expected_calls
-
-    def test_before_command_run_empty_args(self, mocker, fake_metadata):
-        mocker.patch(
-            "kedro_telemetry.plugin._check_for_telemetry_consent", return_value=True
-        )
-        mocker.patch("kedro_telemetry.plugin._is_known_ci_env", return_value=True)
-        mocked_anon_id = mocker.patch("kedro_telemetry.plugin._hash")
-        mocked_anon_id.return_value = "digested"
-        mocker.patch("kedro_telemetry.plugin.PACKAGE_NAME", "spaceflights")
-        mocker.patch(
-            "kedro_telemetry.plugin._get_or_create_uuid",
-            return_value="user_uuid",
-        )
-        mocker.patch(
-            "kedro_telemetry.plugin._get_or_create_project_id",
-            return_value="project_id",
-        )
-
-        mocked_heap_call = mocker.patch("kedro_telemetry.plugin._send_heap_event")
-        telemetry_hook = KedroTelemetryHook()
-        command_args = []
+            (
+                ["--version"],
+                MOCK_PYPROJECT_TOOLS_DATA,
+                {
+                    "command": "kedro --version",
+                    "main_command": "--version",
+                    "tools": "Linting, Testing, Custom Logging, Documentation, Data Structure, PySpark",
+                    "example_pipeline": "True",
+                },
+            ),
+            ([], None, {"command": "kedro", "main_command": "kedro"}),
+        ],
+        ids=["version", "version-with-tools", "no-args"],
+    )
+    def test_before_command_run(  # noqa: PLR0913
+        self,
+        mocker,
+        monkeypatch,
+        fake_metadata,
+        caplog,
+        mocked_heap_call,
+        command_args,
+        pyproject_data,
+        command_properties,
+        telemetry_hook,
+    ):
+        if pyproject_data is not None:
+            mocker.patch("kedro_telemetry.plugin.open", create=True)
+            monkeypatch.setattr(
+                "kedro_telemetry.plugin.toml.load", lambda *_: pyproject_data
+            )
+            monkeypatch.setattr("pathlib.Path.exists", lambda *_, **__: True)
+
+        caplog.set_level(logging.INFO)
         telemetry_hook.before_command_run(fake_metadata, command_args)
         telemetry_hook.after_command_run()
-        expected_properties = {
-            "username": "user_uuid",
-            "project_id": "digested",
-            "project_version": kedro_version,
-            "telemetry_version": TELEMETRY_VERSION,
-            "python_version": sys.version,
-            "os": sys.platform,
-            "is_ci_env": True,
-            "command": "kedro",
-        }
-        generic_properties = {
-            "main_command": "kedro",
-            **expected_properties,
-        }
+        expected_properties = {**PROJECT_PROPERTIES, **command_properties}
 
         expected_calls = [
             mocker.call(
                 event_name="CLI command",
                 identity="user_uuid",
-                properties=generic_properties,
+                properties=expected_properties,
             ),
         ]
-
         assert mocked_heap_call.call_args_list == expected_calls
+        assert any(CONSENT_NOTICE in message for message in caplog.messages)
 
-    def test_before_command_run_no_consent_given(self, mocker, fake_metadata, caplog):
-        mocker.patch(
-            "kedro_telemetry.plugin._check_for_telemetry_consent", return_value=False
+    def test_before_command_run_no_consent_given(
+        self,
+        mocker,
+        monkeypatch,
+        fake_metadata,
+        caplog,
+        telemetry_hook,
+    ):
+        monkeypatch.setattr(
+            "kedro_telemetry.plugin._check_for_telemetry_consent", lambda *_: False
         )
 
         mocked_heap_call = mocker.patch("kedro_telemetry.plugin._send_heap_event")
-        with caplog.at_level(logging.INFO):
-            telemetry_hook = KedroTelemetryHook()
-            command_args = ["--version"]
-            telemetry_hook.before_command_run(fake_metadata, command_args)
+        caplog.set_level(logging.INFO)
+        command_args = ["--version"]
+        telemetry_hook.before_command_run(fake_metadata, command_args)
 
         mocked_heap_call.assert_not_called()
-        assert not any(
-            "Kedro is sending anonymous usage data with the sole purpose of improving the product. "
-            "No personal data or IP addresses are stored on our side. "
-            "If you want to opt out, set the `KEDRO_DISABLE_TELEMETRY` or `DO_NOT_TRACK` environment variables, "
-            "or create a `.telemetry` file in the current working directory with the contents `consent: false`. "
-            "Read more at https://docs.kedro.org/en/latest/configuration/telemetry.html"
-            in record.message
-            for record in caplog.records
-        )
+        assert not any(CONSENT_NOTICE in message for message in caplog.messages)
 
-    def test_before_command_run_connection_error(self, mocker, fake_metadata, caplog):
-        mocker.patch(
-            "kedro_telemetry.plugin._check_for_telemetry_consent", return_value=True
+    def test_before_command_run_connection_error(
+        self,
+        mocker,
+        monkeypatch,
+        fake_metadata,
+        caplog,
+        telemetry_hook,
+    ):
+        monkeypatch.setattr(
+            "kedro_telemetry.plugin._check_for_telemetry_consent", lambda *_: True
         )
-        telemetry_hook = KedroTelemetryHook()
         command_args = ["--version"]
 
         mocked_post_request = mocker.patch(
@@ -332,53 +303,52 @@ class TestKedroTelemetryHook:
         assert msg in caplog.messages[-1]
         mocked_post_request.assert_called()
 
-    def test_before_command_run_anonymous(self, mocker, fake_metadata):
-        mocker.patch(
-            "kedro_telemetry.plugin._check_for_telemetry_consent", return_value=True
+    def test_before_command_run_anonymous(
+        self, mocker, monkeypatch, fake_metadata, telemetry_hook
+    ):
+        monkeypatch.setattr(
+            "kedro_telemetry.plugin._check_for_telemetry_consent", lambda *_: True
         )
-        mocker.patch("kedro_telemetry.plugin._is_known_ci_env", return_value=True)
-        mocked_anon_id = mocker.patch("kedro_telemetry.plugin._hash")
-        mocked_anon_id.return_value = "digested"
-        mocker.patch("kedro_telemetry.plugin.PACKAGE_NAME", "spaceflights")
-        mocker.patch("builtins.open", side_effect=OSError)
+        monkeypatch.setattr("kedro_telemetry.plugin._is_known_ci_env", lambda *_: True)
+        monkeypatch.setattr("kedro_telemetry.plugin._hash", lambda *_: "digested")
+        monkeypatch.setattr("kedro_telemetry.plugin.PACKAGE_NAME", "spaceflights")
+        mocker.patch("kedro_telemetry.plugin.open", side_effect=OSError, create=True)
 
         mocked_heap_call = mocker.patch("kedro_telemetry.plugin._send_heap_event")
-        telemetry_hook = KedroTelemetryHook()
         command_args = ["--version"]
         telemetry_hook.before_command_run(fake_metadata, command_args)
         telemetry_hook.after_command_run()
         expected_properties = {
+            **PROJECT_PROPERTIES,
             "username": "",
-            "command": "kedro --version",
             "project_id": None,
-            "project_version": kedro_version,
-            "telemetry_version": TELEMETRY_VERSION,
-            "python_version": sys.version,
-            "os": sys.platform,
-            "is_ci_env": True,
-        }
-        generic_properties = {
+            "command": "kedro --version",
             "main_command": "--version",
-            **expected_properties,
         }
 
         expected_calls = [
             mocker.call(
                 event_name="CLI command",
                 identity=MISSING_USER_IDENTITY,
-                properties=generic_properties,
+                properties=expected_properties,
             ),
         ]
         assert mocked_heap_call.call_args_list == expected_calls
 
-    def test_before_command_run_heap_call_error(self, mocker, fake_metadata, caplog):
-        mocker.patch(
-            "kedro_telemetry.plugin._check_for_telemetry_consent", return_value=True
+    def test_before_command_run_heap_call_error(
+        self,
+        mocker,
+        monkeypatch,
+        fake_metadata,
+        caplog,
+        telemetry_hook,
+    ):
+        monkeypatch.setattr(
+            "kedro_telemetry.plugin._check_for_telemetry_consent", lambda *_: True
         )
         mocked_heap_call = mocker.patch(
             "kedro_telemetry.plugin._send_heap_event", side_effect=Exception
         )
-        telemetry_hook = KedroTelemetryHook()
         command_args = ["--version"]
 
         telemetry_hook.before_command_run(fake_metadata, command_args)
@@ -390,57 +360,56 @@ class TestKedroTelemetryHook:
         assert msg in caplog.messages[-1]
         mocked_heap_call.assert_called()
 
-    def test_check_for_telemetry_consent_given(self, mocker, fake_metadata):
-        Path(fake_metadata.project_path, "conf").mkdir(parents=True)
-        telemetry_file_path = fake_metadata.project_path / ".telemetry"
-        with open(telemetry_file_path, "w", encoding="utf-8") as telemetry_file:
-            yaml.dump({"consent": True}, telemetry_file)
+    def test_check_for_telemetry_consent_given(
+        self, fake_metadata, telemetry_file_path
+    ):
+        telemetry_file_path.touch()
 
-        assert _check_for_telemetry_consent(fake_metadata.project_path)
+        assert _check_for_telemetry_consent(
+            fake_metadata.project_path, _loader=lambda _: {"consent": True}
+        )
 
-    def test_check_for_telemetry_consent_not_given(self, mocker, fake_metadata):
-        Path(fake_metadata.project_path, "conf").mkdir(parents=True)
-        telemetry_file_path = fake_metadata.project_path / ".telemetry"
-        with open(telemetry_file_path, "w", encoding="utf-8") as telemetry_file:
-            yaml.dump({"consent": False}, telemetry_file)
+    def test_check_for_telemetry_consent_not_given(
+        self, fake_metadata, telemetry_file_path
+    ):
+        # Parsed with the default YAML loader, unlike the other consent tests
+        telemetry_file_path.write_text("consent: false\n", encoding="utf-8")
 
         assert not _check_for_telemetry_consent(fake_metadata.project_path)
 
     @mark.parametrize("env_var", _SKIP_TELEMETRY_ENV_VAR_KEYS)
     def test_check_for_telemetry_consent_skip_telemetry_with_env_var(
-        self, monkeypatch, fake_metadata, env_var
+        self, monkeypatch, fake_metadata, telemetry_file_path, env_var
     ):
         monkeypatch.setenv(env_var, "True")
-        Path(fake_metadata.project_path, "conf").mkdir(parents=True)
-        telemetry_file_path = fake_metadata.project_path / ".telemetry"
-        with open(telemetry_file_path, "w", encoding="utf-8") as telemetry_file:
-            yaml.dump({"consent": True}, telemetry_file)
-
-        assert not _check_for_telemetry_consent(fake_metadata.project_path)
+        telemetry_file_path.touch()
 
-    def test_check_for_telemetry_consent_empty_file(self, mocker, fake_metadata):
-        Path(fake_metadata.project_path, "conf").mkdir(parents=True)
-        telemetry_file_path = fake_metadata.project_path / ".telemetry"
+        assert not _check_for_telemetry_consent(
+            fake_metadata.project_path, _loader=lambda _: {"consent": True}
+        )
 
-        with open(telemetry_file_path, "w", encoding="utf-8") as telemetry_file:
-            yaml.dump({}, telemetry_file)
+    def test_check_for_telemetry_consent_empty_file(
+        self, fake_metadata, telemetry_file_path
+    ):
+        telemetry_file_path.touch()
 
-        assert _check_for_telemetry_consent(fake_metadata.project_path)
+        assert _check_for_telemetry_consent(
+            fake_metadata.project_path, _loader=lambda _: {}
+        )
 
     def test_check_for_telemetry_consent_file_no_consent_field(
-        self, mocker, fake_metadata
+        self, fake_metadata, telemetry_file_path
     ):
-        Path(fake_metadata.project_path, "conf").mkdir(parents=True)
-        telemetry_file_path = fake_metadata.project_path / ".telemetry"
-        with open(telemetry_file_path, "w", encoding="utf8") as telemetry_file:
-            yaml.dump({"nonsense": "bla"}, telemetry_file)
+        telemetry_file_path.touch()
 
-        assert _check_for_telemetry_consent(fake_metadata.project_path)
+        assert _check_for_telemetry_consent(
+            fake_metadata.project_path, _loader=lambda _: {"nonsense": "bla"}
+        )
 
-    def test_check_for_telemetry_consent_file_invalid_yaml(self, mocker, fake_metadata):
-        Path(fake_metadata.project_path, "conf").mkdir(parents=True)
-        telemetry_file_path = fake_metadata.project_path / ".telemetry"
-        telemetry_file_path.write_text("invalid_ yaml")
+    def test_check_for_telemetry_consent_file_invalid_yaml(
+        self, fake_metadata, telemetry_file_path
+    ):
+        telemetry_file_path.write_text("invalid_ yaml", encoding="utf-8")
 
         assert _check_for_telemetry_consent(fake_metadata.project_path)
 
@@ -459,67 +428,45 @@ class TestKedroTelemetryHook:
                 True,
             ),
         ],
+        ids=[
+            "ci-true",
+            "ci-false",
+            "codebuild",
+            "jenkins",
+            "travis",
+            "gitlab",
+            "circle",
+            "bitbucket",
+        ],
     )
-    def test_check_is_known_ci_env(self, monkeypatch, env_vars, result):
+    def test_check_is_known_ci_env(self, monkeypatch, known_ci_vars, env_vars, result):
         for env_var, env_var_value in env_vars.items():
             monkeypatch.setenv(env_var, env_var_value)
 
-        known_ci_vars = KNOWN_CI_ENV_VAR_KEYS
-        # Because our CI runs on Github Actions, this would always return True otherwise
-        known_ci_vars.discard("GITHUB_ACTION")
         assert _is_known_ci_env(known_ci_vars) == result
 
     def test_after_context_created_without_kedro_run(  # noqa: PLR0913
         self,
         mocker,
+        monkeypatch,
         fake_catalog,
         fake_default_pipeline,
         fake_sub_pipeline,
         fake_context,
+        mocked_heap_call,
+        telemetry_hook,
     ):
-        mocker.patch.dict(
-            pipelines, {"__default__": fake_default_pipeline, "sub": fake_sub_pipeline}
-        )
-        mocker.patch(
-            "kedro_telemetry.plugin._check_for_telemetry_consent", return_value=True
-        )
-        mocker.patch("kedro_telemetry.plugin._is_known_ci_env", return_value=True)
-        mocker.patch("kedro_telemetry.plugin._hash", return_value="digested")
-        mocker.patch("kedro_telemetry.plugin.PACKAGE_NAME", "spaceflights")
-        mocker.patch(
-            "kedro_telemetry.plugin._get_or_create_uuid",
-            return_value="user_uuid",
-        )
-        mocker.patch(
-            "kedro_telemetry.plugin._get_or_create_project_id",
-            return_value="project_id",
-        )
-
-        mocked_heap_call = mocker.patch("kedro_telemetry.plugin._send_heap_event")
+        monkeypatch.setitem(pipelines, "__default__", fake_default_pipeline)
+        monkeypatch.setitem(pipelines, "sub", fake_sub_pipeline)
         mocker.patch("kedro_telemetry.plugin.open")
-        mocker.patch("kedro_telemetry.plugin.toml.load")
-        mocker.patch("kedro_telemetry.plugin.toml.dump")
+        monkeypatch.setattr("kedro_telemetry.plugin.toml.load", lambda *_: {})
+        monkeypatch.setattr("kedro_telemetry.plugin.toml.dump", lambda *_: None)
 
         # Without CLI invoked - i.e. `session.run` in Jupyter/IPython
-        telemetry_hook = KedroTelemetryHook()
         telemetry_hook.after_context_created(fake_context)
         telemetry_hook.after_catalog_created(fake_catalog)
 
-        project_properties = {
-            "username": "user_uuid",
-            "project_id": "digested",
-            "project_version": kedro_version,
-            "telemetry_version": TELEMETRY_VERSION,
-            "python_version": sys.version,
-            "os": sys.platform,
-            "is_ci_env": True,
-        }
-        project_statistics = {
-            "number_of_datasets": 3,
-            "number_of_nodes": 2,
-            "number_of_pipelines": 2,
-        }
-        expected_properties = {**project_properties, **project_statistics}
+        expected_properties = {**PROJECT_PROPERTIES, **PROJECT_STATISTICS}
         expected_call = mocker.call(
             event_name="Kedro Project Statistics",
             identity="user_uuid",
@@ -532,57 +479,29 @@ class TestKedroTelemetryHook:
     def test_after_context_created_with_kedro_run(  # noqa: PLR0913
         self,
         mocker,
+        monkeypatch,
         fake_catalog,
         fake_metadata,
         fake_default_pipeline,
         fake_sub_pipeline,
         fake_context,
+        mocked_heap_call,
+        telemetry_hook,
     ):
-        mocker.patch.dict(
-            pipelines, {"__default__": fake_default_pipeline, "sub": fake_sub_pipeline}
-        )
-        mocker.patch(
-            "kedro_telemetry.plugin._check_for_telemetry_consent", return_value=True
-        )
-        mocker.patch("kedro_telemetry.plugin._is_known_ci_env", return_value=True)
-        mocker.patch("kedro_telemetry.plugin._hash", return_value="digested")
-        mocker.patch("kedro_telemetry.plugin.PACKAGE_NAME", "spaceflights")
-        mocker.patch(
-            "kedro_telemetry.plugin._get_or_create_uuid",
-            return_value="user_uuid",
-        )
-        mocker.patch(
-            "kedro_telemetry.plugin._get_or_create_project_id",
-            return_value="project_id",
-        )
-        mocked_heap_call = mocker.patch("kedro_telemetry.plugin._send_heap_event")
-        mocker.patch("kedro_telemetry.plugin.toml.load")
-        mocker.patch("kedro_telemetry.plugin.toml.dump")
+        monkeypatch.setitem(pipelines, "__default__", fake_default_pipeline)
+        monkeypatch.setitem(pipelines, "sub", fake_sub_pipeline)
+        monkeypatch.setattr("kedro_telemetry.plugin.toml.load", lambda *_: {})
+        monkeypatch.setattr("kedro_telemetry.plugin.toml.dump", lambda *_: None)
         # CLI run first
         telemetry_cli_hook = KedroTelemetryHook()
         command_args = ["--version"]
         telemetry_cli_hook.before_command_run(fake_metadata, command_args)
 
         # Follow by project run
-        telemetry_hook = KedroTelemetryHook()
         telemetry_hook.after_context_created(fake_context)
         telemetry_hook.after_catalog_created(fake_catalog)
 
-        project_properties = {
-            "username": "user_uuid",
-            "project_id": "digested",
-            "project_version": kedro_version,
-            "telemetry_version": TELEMETRY_VERSION,
-            "python_version": sys.version,
-            "os": sys.platform,
-            "is_ci_env": True,
-        }
-        project_statistics = {
-            "number_of_datasets": 3,
-            "number_of_nodes": 2,
-            "number_of_pipelines": 2,
-        }
-        expected_properties = {**project_properties, **project_statistics}
+        expected_properties = {**PROJECT_PROPERTIES, **PROJECT_STATISTICS}
 
         expected_call = mocker.call(
             event_name="Kedro Project Statistics",
@@ -595,32 +514,22 @@ class TestKedroTelemetryHook:
     def test_after_context_created_with_kedro_run_and_tools(  # noqa: PLR0913
         self,
         mocker,
+        monkeypatch,
         fake_catalog,
         fake_metadata,
         fake_default_pipeline,
         fake_sub_pipeline,
         fake_context,
+        mocked_heap_call,
+        telemetry_hook,
     ):
-        mocker.patch.dict(
-            pipelines, {"__default__": fake_default_pipeline, "sub": fake_sub_pipeline}
-        )
-        mocker.patch(
-            "kedro_telemetry.plugin._check_for_telemetry_consent", return_value=True
-        )
-        mocker.patch("kedro_telemetry.plugin._is_known_ci_env", return_value=True)
-        mocker.patch("kedro_telemetry.plugin._hash", return_value="digested")
-        mocker.patch("kedro_telemetry.plugin.PACKAGE_NAME", "spaceflights")
-        mocker.patch(
-            "kedro_telemetry.plugin._get_or_create_uuid",
-            return_value="user_uuid",
+        monkeypatch.setitem(pipelines, "__default__", fake_default_pipeline)
+        monkeypatch.setitem(pipelines, "sub", fake_sub_pipeline)
+        mocker.patch("kedro_telemetry.plugin.open", create=True)
+        monkeypatch.setattr(
+            "kedro_telemetry.plugin.toml.load", lambda *_: MOCK_PYPROJECT_TOOLS_DATA
         )
-        mocker.patch(
-            "kedro_telemetry.plugin._get_or_create_project_id",
-            return_value="project_id",
-        )
-        mocked_heap_call = mocker.patch("kedro_telemetry.plugin._send_heap_event")
-        mocker.patch("builtins.open", mocker.mock_open(read_data=MOCK_PYPROJECT_TOOLS))
-        mocker.patch("pathlib.Path.exists", return_value=True)
+        monkeypatch.setattr("pathlib.Path.exists", lambda *_, **__: True)
 
         # CLI run first
         telemetry_cli_hook = KedroTelemetryHook()
@@ -628,27 +537,15 @@ class TestKedroTelemetryHook:
         telemetry_cli_hook.before_command_run(fake_metadata, command_args)
 
         # Follow by project run
-        telemetry_hook = KedroTelemetryHook()
         telemetry_hook.after_context_created(fake_context)
         telemetry_hook.after_catalog_created(fake_catalog)
 
         project_properties = {
-            "username": "user_uuid",
-            "project_id": "digested",
-            "project_version": kedro_version,
-            "telemetry_version": TELEMETRY_VERSION,
-            "python_version": sys.version,
-            "os": sys.platform,
-            "is_ci_env": True,
+            **PROJECT_PROPERTIES,
             "tools": "Linting, Testing, Custom Logging, Documentation, Data Structure, PySpark",
             "example_pipeline": "True",
         }
-        project_statistics = {
-            "number_of_datasets": 3,
-            "number_of_nodes": 2,
-            "number_of_pipelines": 2,
-        }
-        expected_properties = {**project_properties, **project_statistics}
+        expected_properties = {**project_properties, **PROJECT_STATISTICS}
 
         expected_call = mocker.call(
             event_name="Kedro Project Statistics",
@@ -658,14 +555,15 @@ class TestKedroTelemetryHook:
 
         assert mocked_heap_call.call_args_list[0] == expected_call
 
-    def test_after_context_created_no_consent_given(self, mocker):
+    def test_after_context_created_no_consent_given(
+        self, mocker, monkeypatch, telemetry_hook
+    ):
         fake_context = mocker.Mock()
-        mocker.patch(
-            "kedro_telemetry.plugin._check_for_telemetry_consent", return_value=False
+        monkeypatch.setattr(
+            "kedro_telemetry.plugin._check_for_telemetry_consent", lambda *_: False
         )
 
         mocked_heap_call = mocker.patch("kedro_telemetry.plugin._send_heap_event")
-        telemetry_hook = KedroTelemetryHook()
         telemetry_hook.after_context_created(fake_context)
 
         mocked_heap_call.assert_not_called()